@@ -0,0 +1,109 @@
+"""
+Shared pytest configuration and fixtures for the MetaWalletGen CLI test suites.
+"""
+
+import pytest
+
+
+# Installation checks duplicate the enhanced suite; they only run with --smoke.
+# test_installation.py stays importable without pytest, so its tests are
+# marked here rather than with decorators.
+SMOKE_MODULES = {"test_installation.py"}
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--smoke",
+        action="store_true",
+        default=False,
+        help="run the installation smoke tests"
+    )
+    parser.addoption(
+        "--runslow",
+        action="store_true",
+        default=False,
+        help="run slow tests such as the batch generation benchmarks"
+    )
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "smoke: installation smoke test (run with --smoke)")
+    config.addinivalue_line("markers", "slow: slow test (run with --runslow)")
+
+
+def pytest_collection_modifyitems(config, items):
+    run_smoke = config.getoption("--smoke")
+    run_slow = config.getoption("--runslow")
+    skip_smoke = pytest.mark.skip(reason="installation smoke test; use --smoke to run")
+    skip_slow = pytest.mark.skip(reason="slow test; use --runslow to run")
+    
+    for item in items:
+        if item.path.name in SMOKE_MODULES:
+            item.add_marker(pytest.mark.smoke)
+            if not run_smoke:
+                item.add_marker(skip_smoke)
+        if "slow" in item.keywords and not run_slow:
+            item.add_marker(skip_slow)
+
+
+@pytest.fixture
+def workdir(tmp_path, monkeypatch):
+    """Run the test from its own temporary directory with a wallets folder"""
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "wallets").mkdir()
+    return tmp_path
+
+
+@pytest.fixture(scope="session")
+def wallet_pool():
+    """Testnet wallets generated once per session and sliced by tests"""
+    from metawalletgen.core.wallet_generator import WalletGenerator
+    
+    generator = WalletGenerator(network="testnet")
+    return generator.generate_batch_wallets(10)
+
+
+@pytest.fixture
+def fast_wallet():
+    """Hardcoded wallet for tests that only exercise storage or encryption"""
+    from metawalletgen.core.wallet_generator import WalletData
+    
+    return WalletData(
+        address="0x742d35Cc6634C0532925a3b8D4C9db96C4b4d8b6",
+        private_key="0x" + "a" * 64,
+        mnemonic="abandon ability able about above absent absorb abstract absurd abuse access accident",
+        derivation_path="m/44'/60'/0'/0/0",
+        network="testnet"
+    )
+
+
+@pytest.fixture(scope="session")
+def vault_password():
+    """Password used for the shared encrypted wallet file"""
+    return "secure_password_123"
+
+
+@pytest.fixture(scope="session")
+def encrypted_blob(wallet_pool, vault_password, tmp_path_factory):
+    """Encrypted JSON wallet file written once per session; returns its path"""
+    from metawalletgen.core.storage_manager import StorageManager
+    
+    storage = StorageManager(output_dir=str(tmp_path_factory.mktemp("enc")))
+    return storage.save_wallets_json(
+        wallet_pool[:2], "encrypted.json",
+        encrypt=True, password=vault_password
+    )
+
+
+@pytest.fixture(scope="session")
+def enc_mgr():
+    """Encryption manager shared by the encryption tests"""
+    from metawalletgen.core.encryption import EncryptionManager
+    
+    return EncryptionManager()
+
+
+@pytest.fixture(scope="session")
+def enc_key(enc_mgr):
+    """Key derived once from the test password with the shared manager's salt"""
+    return enc_mgr.derive_key("test_password_123")
@@ -13,12 +13,28 @@ __version__ = "1.0.0"
 __author__ = "JustineDevs"
 __email__ = "contact@justinedevs.com"
 
-from .core.wallet_generator import WalletGenerator
-from .core.storage_manager import StorageManager
-from .core.encryption import EncryptionManager
+from typing import TYPE_CHECKING
+
+from .utils.lazy_imports import lazy_getattr
+
+if TYPE_CHECKING:
+    from .core.wallet_generator import WalletGenerator
+    from .core.storage_manager import StorageManager
+    from .core.encryption import EncryptionManager
+
+# Resolved on first access (PEP 562) so `import metawalletgen` does not load
+# hdwallet, web3 and cryptography before they are needed
+_LAZY_IMPORTS = {
+    "WalletGenerator": ".core.wallet_generator",
+    "StorageManager": ".core.storage_manager",
+    "EncryptionManager": ".core.encryption",
+}
 
 __all__ = [
     "WalletGenerator",
     "StorageManager", 
     "EncryptionManager",
-] 
\ No newline at end of file
+]
+
+
+__getattr__ = lazy_getattr(__name__, _LAZY_IMPORTS)
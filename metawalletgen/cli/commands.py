@@ -8,7 +8,8 @@ for the MetaWalletGen CLI tool with enhanced validation and error handling.
 import sys
 import os
 import datetime
-from typing import Optional
+from functools import lru_cache
+from typing import Iterable, Iterator, List, Optional
 import click
 from rich.console import Console
 from rich.table import Table
@@ -18,19 +19,89 @@ from rich.text import Text
 from rich.prompt import Prompt, Confirm
 from rich.syntax import Syntax
 from tqdm import tqdm
-from pathlib import Path
 
-from ..core.wallet_generator import WalletGenerator
+from ..core.wallet_generator import WalletData, WalletGenerator, PARALLEL_MIN_BATCH
 from ..core.storage_manager import StorageManager
 from ..utils.validators import (
-    validate_ethereum_address, 
-    validate_private_key, 
     validate_mnemonic, 
-    validate_derivation_path
+    validate_derivation_path,
+    validate_addresses,
+    validate_private_keys
 )
 
 console = Console()
 
+# Bytes read from each file when checking for an encrypted vault header;
+# StorageManager writes "encrypted" as the second key of the vault
+VAULT_HEADER_BYTES = 64
+
+# Verbose validation results longer than this are printed as plain text
+PLAIN_DETAIL_MIN = 1000
+
+# StorageManager methods that write each output format
+SAVE_HANDLERS = {
+    "json": "save_wallets_json",
+    "csv": "save_wallets_csv",
+    "yaml": "save_wallets_yaml",
+    "ndjson": "save_wallets_ndjson",
+}
+
+# StorageManager methods that read each input file extension
+LOAD_HANDLERS = {
+    ".json": "load_wallets_json",
+    ".csv": "load_wallets_csv",
+    ".yaml": "load_wallets_yaml",
+    ".yml": "load_wallets_yaml",
+    ".ndjson": "load_wallets_ndjson",
+}
+
+
+@lru_cache(maxsize=4)
+def _generator(network: str) -> WalletGenerator:
+    """Return the wallet generator for a network, created once per process."""
+    return WalletGenerator(network=network)
+
+
+def _batch_progress(console: Console) -> Progress:
+    """Create the progress bar shown while generating a batch of wallets."""
+    return Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        BarColumn(),
+        TaskProgressColumn(),
+        console=console
+    )
+
+
+def _iter_generated_wallets(
+    generator: WalletGenerator, count: int, progress: Progress, verbose: bool
+) -> Iterator[WalletData]:
+    """Yield new wallets, advancing a progress task as each one is generated."""
+    task = progress.add_task("Generating wallets...", total=count)
+    
+    if count >= PARALLEL_MIN_BATCH:
+        wallet_iter = generator.iter_batch_wallets_parallel(count)
+    else:
+        wallet_iter = (generator.generate_new_wallet(index=i) for i in range(count))
+    
+    for i, wallet in enumerate(wallet_iter, 1):
+        progress.update(task, advance=1)
+        
+        if verbose and i % 100 == 0:
+            progress.print(f"[green]Generated {i}/{count} wallets[/green]")
+        
+        yield wallet
+
+
+def _retain_first(
+    wallets: Iterable[WalletData], kept: List[WalletData], limit: int
+) -> Iterator[WalletData]:
+    """Pass wallets through, appending the first `limit` of them to `kept`."""
+    for wallet in wallets:
+        if len(kept) < limit:
+            kept.append(wallet)
+        yield wallet
+
 
 def validate_generation_inputs(count: int, strength: int, network: str, derivation: Optional[str]) -> None:
     """Validate all generation inputs before processing."""
@@ -57,6 +128,13 @@ def validate_generation_inputs(count: int, strength: int, network: str, derivati
         sys.exit(1)
 
 
+def check_format_encryption(format: str, encrypt: bool) -> None:
+    """Reject output formats that cannot be written encrypted."""
+    if encrypt and format == "ndjson":
+        console.print("[red]NDJSON output cannot be encrypted; use json, csv or yaml[/red]")
+        sys.exit(1)
+
+
 def get_encryption_password(encrypt: bool, password: Optional[str], confirm: bool = True) -> Optional[str]:
     """Get encryption password with proper validation."""
     if not encrypt:
@@ -103,9 +181,10 @@ def generate_command(
     
     # Enhanced input validation
     validate_generation_inputs(count, strength, network, derivation)
+    check_format_encryption(format, encrypt)
     
     # Initialize components
-    generator = WalletGenerator(network=network)
+    generator = _generator(network)
     storage = StorageManager()
     
     # Handle encryption password with enhanced security
@@ -125,6 +204,10 @@ def generate_command(
     # Generate wallets with enhanced progress tracking
     console.print(f"[blue]Generating {count} wallet(s)...[/blue]")
     
+    # NDJSON batches are written while they are generated instead of being
+    # collected first, so memory use does not grow with the batch size
+    stream_ndjson = count > 1 and format == "ndjson"
+    
     if count == 1:
         # Single wallet generation
         with Progress(
@@ -135,25 +218,10 @@ def generate_command(
             task = progress.add_task("Generating wallet...", total=1)
             wallets = [generator.generate_new_wallet()]
             progress.update(task, advance=1)
-    else:
+    elif not stream_ndjson:
         # Batch wallet generation with progress bar
-        wallets = []
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            BarColumn(),
-            TaskProgressColumn(),
-            console=console
-        ) as progress:
-            task = progress.add_task("Generating wallets...", total=count)
-            
-            for i in range(count):
-                wallet = generator.generate_new_wallet(index=i)
-                wallets.append(wallet)
-                progress.update(task, advance=1)
-                
-                if verbose and (i + 1) % 100 == 0:
-                    progress.print(f"[green]Generated {i + 1}/{count} wallets[/green]")
+        with _batch_progress(console) as progress:
+            wallets = list(_iter_generated_wallets(generator, count, progress, verbose))
     
     # Generate output filename if not provided
     if not output:
@@ -166,21 +234,24 @@ def generate_command(
     
     # Save wallets with enhanced error handling
     try:
-        if format == "json":
-            filepath = storage.save_wallets_json(
-                wallets, output, encrypt=encrypt, password=password
-            )
-        elif format == "csv":
-            filepath = storage.save_wallets_csv(
-                wallets, output, encrypt=encrypt, password=password
-            )
-        elif format == "yaml":
-            filepath = storage.save_wallets_yaml(
-                wallets, output, encrypt=encrypt, password=password
-            )
+        if stream_ndjson:
+            # Only the wallets needed for the summary or the preview are kept
+            wallets = []
+            keep = count if summary else (3 if verbose else 0)
+            with _batch_progress(console) as progress:
+                filepath = storage.save_wallets_ndjson(
+                    _retain_first(
+                        _iter_generated_wallets(generator, count, progress, verbose),
+                        wallets, keep
+                    ),
+                    output
+                )
+        else:
+            save = getattr(storage, SAVE_HANDLERS[format])
+            filepath = save(wallets, output, encrypt=encrypt, password=password)
         
         # Enhanced success feedback
-        console.print(f"[green]✅ Successfully generated {len(wallets)} wallet(s)[/green]")
+        console.print(f"[green]✅ Successfully generated {count} wallet(s)[/green]")
         console.print(f"[green]📁 Saved to: {filepath}[/green]")
         
         # Show file size and location
@@ -255,8 +326,10 @@ def import_command(
         console.print(f"[red]❌ Input file not found: {input_file}[/red]")
         sys.exit(1)
     
+    check_format_encryption(format, encrypt)
+    
     # Initialize components
-    generator = WalletGenerator(network=network)
+    generator = _generator(network)
     storage = StorageManager()
     
     # Handle encryption password
@@ -264,15 +337,11 @@ def import_command(
     
     try:
         # Import wallets based on file type
-        if input_file.endswith('.json'):
-            wallets = storage.load_wallets_json(input_file)
-        elif input_file.endswith('.csv'):
-            wallets = storage.load_wallets_csv(input_file)
-        elif input_file.endswith('.yaml') or input_file.endswith('.yml'):
-            wallets = storage.load_wallets_yaml(input_file)
-        else:
+        handler = LOAD_HANDLERS.get(os.path.splitext(input_file)[1].lower())
+        if handler is None:
             console.print(f"[red]❌ Unsupported file format: {input_file}[/red]")
             sys.exit(1)
+        wallets = getattr(storage, handler)(input_file)
         
         if not wallets:
             console.print(f"[yellow]⚠️  No wallets found in {input_file}[/yellow]")
@@ -284,9 +353,10 @@ def import_command(
         if verbose:
             console.print(f"[blue]Validating imported wallets...[/blue]")
             valid_count = 0
-            for i, wallet in enumerate(wallets):
-                if (validate_ethereum_address(wallet.address) and 
-                    validate_private_key(wallet.private_key)):
+            addresses_valid = validate_addresses([wallet.address for wallet in wallets])
+            keys_valid = validate_private_keys([wallet.private_key for wallet in wallets])
+            for i, (address_ok, key_ok) in enumerate(zip(addresses_valid, keys_valid)):
+                if address_ok and key_ok:
                     valid_count += 1
                 else:
                     console.print(f"[yellow]⚠️  Wallet {i+1} has invalid data[/yellow]")
@@ -300,18 +370,8 @@ def import_command(
             output = f"{base_name}_imported_{timestamp}.{format}"
         
         # Save imported wallets
-        if format == "json":
-            filepath = storage.save_wallets_json(
-                wallets, output, encrypt=encrypt, password=password
-            )
-        elif format == "csv":
-            filepath = storage.save_wallets_csv(
-                wallets, output, encrypt=encrypt, password=password
-            )
-        elif format == "yaml":
-            filepath = storage.save_wallets_yaml(
-                wallets, output, encrypt=encrypt, password=password
-            )
+        save = getattr(storage, SAVE_HANDLERS[format])
+        filepath = save(wallets, output, encrypt=encrypt, password=password)
         
         console.print(f"[green]📁 Saved imported wallets to: {filepath}[/green]")
         
@@ -346,10 +406,13 @@ def list_command(ctx, directory, verbose):
         console.print(f"[red]❌ Directory not found: {directory}[/red]")
         sys.exit(1)
     
-    # Find wallet files
-    wallet_files = []
-    for ext in ['*.json', '*.csv', '*.yaml', '*.yml']:
-        wallet_files.extend(Path(directory).glob(ext))
+    # Find wallet files in one directory pass; DirEntry caches file type and stat
+    wallet_exts = {'.json', '.csv', '.yaml', '.yml', '.ndjson'}
+    with os.scandir(directory) as entries:
+        wallet_files = [
+            entry for entry in entries
+            if entry.is_file() and os.path.splitext(entry.name)[1].lower() in wallet_exts
+        ]
     
     if not wallet_files:
         console.print(f"[yellow]⚠️  No wallet files found in {directory}[/yellow]")
@@ -365,29 +428,30 @@ def list_command(ctx, directory, verbose):
     table.add_column("Type", style="blue")
     table.add_column("Encrypted", style="red")
     
-    for file_path in sorted(wallet_files):
+    for entry in sorted(wallet_files, key=lambda e: e.name):
         try:
-            stat = file_path.stat()
+            stat = entry.stat()
             size_mb = stat.st_size / (1024 * 1024)
             modified = datetime.datetime.fromtimestamp(stat.st_mtime).strftime("%Y-%m-%d %H:%M")
             
             # Determine file type and encryption status
-            file_type = file_path.suffix[1:].upper()
+            file_type = os.path.splitext(entry.name)[1][1:].upper()
             is_encrypted = "Unknown"
             
             # Try to detect if file is encrypted
             try:
-                with open(file_path, 'r') as f:
-                    content = f.read(100)  # Read first 100 chars
-                    if '"encrypted": true' in content or '"vault"' in content:
-                        is_encrypted = "Yes"
-                    else:
-                        is_encrypted = "No"
-            except:
+                with open(entry.path, 'rb', buffering=0) as f:
+                    header = f.read(VAULT_HEADER_BYTES)
+                if (b'"encrypted": true' in header or b'"encrypted":true' in header
+                        or b'"vault"' in header):
+                    is_encrypted = "Yes"
+                else:
+                    is_encrypted = "No"
+            except OSError:
                 is_encrypted = "Error"
             
             table.add_row(
-                file_path.name,
+                entry.name,
                 f"{size_mb:.2f} MB",
                 modified,
                 file_type,
@@ -395,7 +459,7 @@ def list_command(ctx, directory, verbose):
             )
         except Exception as e:
             if verbose:
-                console.print(f"[yellow]⚠️  Error reading {file_path.name}: {e}[/yellow]")
+                console.print(f"[yellow]⚠️  Error reading {entry.name}: {e}[/yellow]")
     
     console.print(table)
     console.print(f"[green]✅ Found {len(wallet_files)} wallet file(s)[/green]")
@@ -418,15 +482,11 @@ def validate_command(ctx, input_file, verbose):
     try:
         # Load wallets
         storage = StorageManager()
-        if input_file.endswith('.json'):
-            wallets = storage.load_wallets_json(input_file)
-        elif input_file.endswith('.csv'):
-            wallets = storage.load_wallets_csv(input_file)
-        elif input_file.endswith('.yaml') or input_file.endswith('.yml'):
-            wallets = storage.load_wallets_yaml(input_file)
-        else:
+        handler = LOAD_HANDLERS.get(os.path.splitext(input_file)[1].lower())
+        if handler is None:
             console.print(f"[red]❌ Unsupported file format: {input_file}[/red]")
             sys.exit(1)
+        wallets = getattr(storage, handler)(input_file)
         
         if not wallets:
             console.print(f"[yellow]⚠️  No wallets found in {input_file}[/yellow]")
@@ -444,37 +504,52 @@ def validate_command(ctx, input_file, verbose):
             'details': []
         }
         
-        # Validate each wallet
-        for i, wallet in enumerate(wallets):
-            wallet_errors = []
-            
-            # Validate address
-            if not validate_ethereum_address(wallet.address):
-                wallet_errors.append("Invalid address")
-                validation_results['invalid_address'] += 1
-            
-            # Validate private key
-            if not validate_private_key(wallet.private_key):
-                wallet_errors.append("Invalid private key")
-                validation_results['invalid_private_key'] += 1
-            
-            # Validate mnemonic if present
-            if wallet.mnemonic and not validate_mnemonic(wallet.mnemonic):
-                wallet_errors.append("Invalid mnemonic")
-                validation_results['invalid_mnemonic'] += 1
-            
-            if not wallet_errors:
-                validation_results['valid'] += 1
-                status = "✅ Valid"
-            else:
-                status = f"❌ {'; '.join(wallet_errors)}"
+        # Check addresses and private keys for the whole batch up front
+        addresses_valid = validate_addresses([wallet.address for wallet in wallets])
+        keys_valid = validate_private_keys([wallet.private_key for wallet in wallets])
+        
+        if not verbose:
+            # Only the summary is shown, so count results without building details
+            validation_results['invalid_address'] = addresses_valid.count(False)
+            validation_results['invalid_private_key'] = keys_valid.count(False)
             
-            validation_results['details'].append({
-                'index': i + 1,
-                'address': wallet.address,
-                'status': status,
-                'errors': wallet_errors
-            })
+            for wallet, address_ok, key_ok in zip(wallets, addresses_valid, keys_valid):
+                if wallet.mnemonic and not validate_mnemonic(wallet.mnemonic):
+                    validation_results['invalid_mnemonic'] += 1
+                elif address_ok and key_ok:
+                    validation_results['valid'] += 1
+        else:
+            # Validate each wallet, keeping per-wallet details for the verbose table
+            for i, wallet in enumerate(wallets):
+                wallet_errors = []
+                
+                # Validate address
+                if not addresses_valid[i]:
+                    wallet_errors.append("Invalid address")
+                    validation_results['invalid_address'] += 1
+                
+                # Validate private key
+                if not keys_valid[i]:
+                    wallet_errors.append("Invalid private key")
+                    validation_results['invalid_private_key'] += 1
+                
+                # Validate mnemonic if present
+                if wallet.mnemonic and not validate_mnemonic(wallet.mnemonic):
+                    wallet_errors.append("Invalid mnemonic")
+                    validation_results['invalid_mnemonic'] += 1
+                
+                if not wallet_errors:
+                    validation_results['valid'] += 1
+                    status = "✅ Valid"
+                else:
+                    status = f"❌ {'; '.join(wallet_errors)}"
+                
+                validation_results['details'].append({
+                    'index': i + 1,
+                    'address': wallet.address,
+                    'status': status,
+                    'errors': wallet_errors
+                })
         
         # Display validation summary
         console.print(f"\n[blue]📊 Validation Summary:[/blue]")
@@ -498,19 +573,31 @@ def validate_command(ctx, input_file, verbose):
         # Display detailed results if verbose
         if verbose:
             console.print(f"\n[blue]📋 Detailed Results:[/blue]")
-            detail_table = Table(show_header=True, header_style="bold magenta")
-            detail_table.add_column("Index", style="cyan")
-            detail_table.add_column("Address", style="green")
-            detail_table.add_column("Status", style="yellow")
-            
-            for detail in validation_results['details']:
-                detail_table.add_row(
-                    str(detail['index']),
-                    f"{detail['address'][:10]}...{detail['address'][-8:]}",
-                    detail['status']
-                )
+            detail_rows = [
+                (str(detail['index']),
+                 f"{detail['address'][:10]}...{detail['address'][-8:]}",
+                 detail['status'])
+                for detail in validation_results['details']
+            ]
             
-            console.print(detail_table)
+            if len(detail_rows) > PLAIN_DETAIL_MIN:
+                # Rendering a Rich table this size takes seconds; write plain lines instead
+                if not console.quiet:
+                    console.file.write(
+                        f"{'Index':>6}  {'Address':<21}  Status\n"
+                        + "".join(f"{index:>6}  {address:<21}  {status}\n"
+                                  for index, address, status in detail_rows)
+                    )
+            else:
+                detail_table = Table(show_header=True, header_style="bold magenta")
+                detail_table.add_column("Index", style="cyan")
+                detail_table.add_column("Address", style="green")
+                detail_table.add_column("Status", style="yellow")
+                
+                for row in detail_rows:
+                    detail_table.add_row(*row)
+                
+                console.print(detail_table)
         
         # Final status
         if validation_results['valid'] == validation_results['total']:
@@ -37,7 +37,7 @@ def main(ctx, verbose, quiet):
     - Generating wallets using BIP-39/BIP-44 standards
     - Batch wallet creation with progress tracking
     - Encrypted storage with AES-256
-    - Multiple output formats (JSON, CSV, YAML)
+    - Multiple output formats (JSON, CSV, YAML, NDJSON)
     - Wallet validation and import/export
     - MetaMask compatibility
     - Enhanced security features
@@ -71,7 +71,7 @@ def main(ctx, verbose, quiet):
 )
 @click.option(
     "--format", "-f",
-    type=click.Choice(["json", "csv", "yaml"]),
+    type=click.Choice(["json", "csv", "yaml", "ndjson"]),
     default="json",
     help="Output format (default: json)"
 )
@@ -144,7 +144,7 @@ def generate(ctx, count, output, format, encrypt, password,
 )
 @click.option(
     "--format", "-f",
-    type=click.Choice(["json", "csv", "yaml"]),
+    type=click.Choice(["json", "csv", "yaml", "ndjson"]),
     default="json",
     help="Output format (default: json)"
 )
@@ -178,7 +178,7 @@ def import_wallets(ctx, input_file, output, format, encrypt, password,
     """
     Import wallets from existing data files with validation.
     
-    Supported formats: JSON, CSV, YAML
+    Supported formats: JSON, CSV, YAML, NDJSON
     
     Examples:
         # Import from JSON file
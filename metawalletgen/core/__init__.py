@@ -7,12 +7,27 @@ This module contains the main business logic for:
 - Data validation and formatting
 """
 
-from .wallet_generator import WalletGenerator
-from .storage_manager import StorageManager
-from .encryption import EncryptionManager
+from typing import TYPE_CHECKING
+
+from ..utils.lazy_imports import lazy_getattr
+
+if TYPE_CHECKING:
+    from .wallet_generator import WalletGenerator
+    from .storage_manager import StorageManager
+    from .encryption import EncryptionManager
+
+# Submodule each public class is imported from on first access (PEP 562)
+_LAZY_IMPORTS = {
+    "WalletGenerator": ".wallet_generator",
+    "StorageManager": ".storage_manager",
+    "EncryptionManager": ".encryption",
+}
 
 __all__ = [
     "WalletGenerator",
     "StorageManager",
     "EncryptionManager",
-] 
\ No newline at end of file
+]
+
+
+__getattr__ = lazy_getattr(__name__, _LAZY_IMPORTS)
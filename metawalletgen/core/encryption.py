@@ -7,6 +7,7 @@ for storing sensitive wallet data using AES-256 encryption.
 
 import os
 import base64
+import secrets
 import hashlib
 import datetime
 from typing import Optional, Union
@@ -17,58 +18,81 @@ from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
 from cryptography.hazmat.backends import default_backend
 
 
+# PBKDF2 rounds used when no explicit count is configured
+DEFAULT_KDF_ITERATIONS = 100000
+
+# Range of PBKDF2 rounds accepted from a vault being decrypted
+MIN_VAULT_KDF_ITERATIONS = 1000
+MAX_VAULT_KDF_ITERATIONS = 10000000
+
+# Characters used by generate_secure_password
+PASSWORD_ALPHABET = "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789!@#$%^&*"
+
+# Random bytes at or above this value are rejected so that byte % len(alphabet) stays uniform
+_PASSWORD_BYTE_LIMIT = 256 - (256 % len(PASSWORD_ALPHABET))
+
+
 class EncryptionManager:
     """
     Manages encryption and decryption of sensitive wallet data
     using AES-256 encryption with PBKDF2 key derivation.
     """
     
-    def __init__(self, salt: Optional[bytes] = None):
+    def __init__(self, salt: Optional[bytes] = None,
+                 kdf_iterations: int = DEFAULT_KDF_ITERATIONS):
         """
         Initialize the encryption manager.
         
         Args:
             salt: Optional salt for key derivation (generated if not provided)
+            kdf_iterations: Number of PBKDF2 iterations used to derive keys
         """
+        if kdf_iterations < 1:
+            raise ValueError("kdf_iterations must be a positive integer")
+        
         self.salt = salt or os.urandom(16)
+        self.kdf_iterations = kdf_iterations
         self.backend = default_backend()
     
-    def derive_key(self, password: str, iterations: int = 100000) -> bytes:
+    def derive_key(self, password: str, iterations: Optional[int] = None,
+                   salt: Optional[bytes] = None) -> bytes:
         """
         Derive encryption key from password using PBKDF2.
         
         Args:
             password: User password
-            iterations: Number of PBKDF2 iterations
+            iterations: Number of PBKDF2 iterations (defaults to kdf_iterations)
+            salt: Salt for key derivation (defaults to the manager's salt)
             
         Returns:
             Derived encryption key
         """
+        if iterations is None:
+            iterations = self.kdf_iterations
+        if salt is None:
+            salt = self.salt
+        
         kdf = PBKDF2HMAC(
             algorithm=hashes.SHA256(),
             length=32,
-            salt=self.salt,
+            salt=salt,
             iterations=iterations,
             backend=self.backend
         )
         return base64.urlsafe_b64encode(kdf.derive(password.encode()))
     
-    def encrypt_data(self, data: str, password: str) -> str:
+    def encrypt_data(self, data: Union[str, bytes], password: str) -> str:
         """
         Encrypt data using AES-256.
         
         Args:
-            data: Data to encrypt
+            data: Data to encrypt (text is UTF-8 encoded, bytes are used as-is)
             password: Encryption password
             
         Returns:
             Base64 encoded encrypted data
         """
-        key = self.derive_key(password)
-        f = Fernet(key)
-        
-        encrypted_data = f.encrypt(data.encode())
-        return base64.b64encode(encrypted_data).decode()
+        return self.encrypt_with_key(data, self.derive_key(password))
     
     def decrypt_data(self, encrypted_data: str, password: str) -> str:
         """
@@ -81,7 +105,40 @@ class EncryptionManager:
         Returns:
             Decrypted data
         """
-        key = self.derive_key(password)
+        return self.decrypt_with_key(encrypted_data, self.derive_key(password))
+    
+    def encrypt_with_key(self, data: Union[str, bytes], key: bytes) -> str:
+        """
+        Encrypt data with a key already returned by derive_key.
+        
+        Skips PBKDF2, so callers encrypting many items with one password
+        can derive the key once.
+        
+        Args:
+            data: Data to encrypt (text is UTF-8 encoded, bytes are used as-is)
+            key: Derived encryption key
+            
+        Returns:
+            Base64 encoded encrypted data
+        """
+        f = Fernet(key)
+        
+        if isinstance(data, str):
+            data = data.encode()
+        encrypted_data = f.encrypt(data)
+        return base64.b64encode(encrypted_data).decode()
+    
+    def decrypt_with_key(self, encrypted_data: str, key: bytes) -> str:
+        """
+        Decrypt data with a key already returned by derive_key.
+        
+        Args:
+            encrypted_data: Base64 encoded encrypted data
+            key: Derived encryption key
+            
+        Returns:
+            Decrypted data
+        """
         f = Fernet(key)
         
         encrypted_bytes = base64.b64decode(encrypted_data.encode())
@@ -162,9 +219,18 @@ class EncryptionManager:
         Returns:
             Secure password string
         """
-        import secrets
-        alphabet = "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789!@#$%^&*"
-        return ''.join(secrets.choice(alphabet) for _ in range(length))
+        alphabet_size = len(PASSWORD_ALPHABET)
+        chars = []
+        
+        # Draw random bytes in bulk and keep only unbiased ones
+        while len(chars) < length:
+            for byte in secrets.token_bytes(2 * (length - len(chars))):
+                if byte < _PASSWORD_BYTE_LIMIT:
+                    chars.append(PASSWORD_ALPHABET[byte % alphabet_size])
+                    if len(chars) == length:
+                        break
+        
+        return ''.join(chars)
     
     def hash_password(self, password: str) -> str:
         """
@@ -229,7 +295,8 @@ class EncryptionManager:
             "data": encrypted_data,
             "created_at": str(datetime.datetime.now()),
             "algorithm": "AES-256",
-            "key_derivation": "PBKDF2-HMAC-SHA256"
+            "key_derivation": "PBKDF2-HMAC-SHA256",
+            "kdf_iterations": self.kdf_iterations
         }
         
         return vault
@@ -245,11 +312,19 @@ class EncryptionManager:
         Returns:
             Decrypted data dictionary
         """
+        import json
+        
         if not vault.get("encrypted", False):
             raise ValueError("Vault is not encrypted")
         
-        # Set salt from vault
-        self.set_salt(vault["salt"])
+        # Read salt and key derivation cost from the vault without adopting
+        # them, so later vaults created by this manager keep its own settings
+        salt = base64.b64decode(vault["salt"].encode())
+        iterations = vault.get("kdf_iterations", DEFAULT_KDF_ITERATIONS)
+        if (not isinstance(iterations, int) or isinstance(iterations, bool)
+                or not MIN_VAULT_KDF_ITERATIONS <= iterations <= MAX_VAULT_KDF_ITERATIONS):
+            raise ValueError(f"Unsupported vault kdf_iterations: {iterations!r}")
         
         # Decrypt data
-        return self.decrypt_wallet_data(vault["data"], password) 
\ No newline at end of file
+        key = self.derive_key(password, iterations, salt=salt)
+        return json.loads(self.decrypt_with_key(vault["data"], key))
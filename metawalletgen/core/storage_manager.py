@@ -6,16 +6,21 @@ format conversion for wallet data storage.
 """
 
 import os
-import json
+import io
 import csv
 import yaml
-from typing import List, Dict, Optional, Union
+import orjson
+from typing import Iterable, List, Dict, Optional, Union
 from pathlib import Path
 from .wallet_generator import WalletData
 from .encryption import EncryptionManager
 import datetime
 
 
+# Write buffer for streamed NDJSON output
+NDJSON_BUFFER_SIZE = 1 << 20
+
+
 class StorageManager:
     """
     Manages storage and retrieval of wallet data in various formats
@@ -69,11 +74,12 @@ class StorageManager:
             # Create encrypted vault
             vault = self.encryption_manager.create_encrypted_vault(data, password)
             
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(vault, f, indent=2)
+            with open(filepath, 'wb') as f:
+                f.write(orjson.dumps(vault, option=orjson.OPT_INDENT_2))
         else:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2)
+            # orjson serializes straight to UTF-8 bytes, written in one call
+            with open(filepath, 'wb') as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
         
         return str(filepath)
     
@@ -114,16 +120,19 @@ class StorageManager:
                 {"wallets": wallet_dicts}, password
             )
             
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(vault, f, indent=2)
+            with open(filepath, 'wb') as f:
+                f.write(orjson.dumps(vault, option=orjson.OPT_INDENT_2))
         else:
-            # Write CSV
+            # Build the CSV in memory, then write it in one call
+            buffer = io.StringIO(newline='')
+            if wallet_dicts:
+                fieldnames = wallet_dicts[0].keys()
+                writer = csv.DictWriter(buffer, fieldnames=fieldnames)
+                writer.writeheader()
+                writer.writerows(wallet_dicts)
+            
             with open(filepath, 'w', newline='', encoding='utf-8') as f:
-                if wallet_dicts:
-                    fieldnames = wallet_dicts[0].keys()
-                    writer = csv.DictWriter(f, fieldnames=fieldnames)
-                    writer.writeheader()
-                    writer.writerows(wallet_dicts)
+                f.write(buffer.getvalue())
         
         return str(filepath)
     
@@ -164,10 +173,48 @@ class StorageManager:
             vault = self.encryption_manager.create_encrypted_vault(data, password)
             
             with open(filepath, 'w', encoding='utf-8') as f:
-                yaml.dump(vault, f, default_flow_style=False)
+                f.write(yaml.dump(vault, default_flow_style=False))
         else:
+            # yaml.dump returns the document when no stream is given; write it once
             with open(filepath, 'w', encoding='utf-8') as f:
-                yaml.dump(data, f, default_flow_style=False)
+                f.write(yaml.dump(data, default_flow_style=False))
+        
+        return str(filepath)
+    
+    def save_wallets_ndjson(
+        self, 
+        wallets: Iterable[WalletData], 
+        filename: str,
+        encrypt: bool = False,
+        password: Optional[str] = None
+    ) -> str:
+        """
+        Save wallets to a newline-delimited JSON file, one wallet per line.
+        
+        Wallets are serialized and written as they are consumed, so a
+        generator can be passed without holding the whole batch in memory.
+        
+        Args:
+            wallets: Iterable of WalletData objects
+            filename: Output filename
+            encrypt: Not supported for NDJSON; must be False
+            password: Unused, accepted for parity with the other formats
+            
+        Returns:
+            Path to saved file
+        """
+        if encrypt:
+            raise ValueError("NDJSON output cannot be encrypted; use json, csv or yaml")
+        
+        # Ensure filename has .ndjson extension
+        if not filename.endswith('.ndjson'):
+            filename += '.ndjson'
+        
+        filepath = self.output_dir / filename
+        
+        with open(filepath, 'wb', buffering=NDJSON_BUFFER_SIZE) as f:
+            for wallet in wallets:
+                f.write(orjson.dumps(wallet.to_dict(), option=orjson.OPT_APPEND_NEWLINE))
         
         return str(filepath)
     
@@ -190,8 +237,8 @@ class StorageManager:
         """
         filepath = self.output_dir / filename
         
-        with open(filepath, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        with open(filepath, 'rb') as f:
+            data = orjson.loads(f.read())
         
         if decrypt:
             if not password:
@@ -241,8 +288,8 @@ class StorageManager:
             if not password:
                 raise ValueError("Password required for decryption")
             
-            with open(filepath, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            with open(filepath, 'rb') as f:
+                data = orjson.loads(f.read())
             
             # Decrypt vault
             decrypted_data = self.encryption_manager.decrypt_vault(data, password)
@@ -270,6 +317,37 @@ class StorageManager:
         
         return wallets
     
+    def load_wallets_ndjson(self, filename: str) -> List[WalletData]:
+        """
+        Load wallets from a newline-delimited JSON file.
+        
+        Args:
+            filename: Input filename
+            
+        Returns:
+            List of WalletData objects
+        """
+        filepath = self.output_dir / filename
+        
+        wallets = []
+        with open(filepath, 'rb') as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                
+                wallet_dict = orjson.loads(line)
+                wallet = WalletData(
+                    address=wallet_dict["address"],
+                    private_key=wallet_dict["private_key"],
+                    mnemonic=wallet_dict["mnemonic"],
+                    derivation_path=wallet_dict["derivation_path"],
+                    network=wallet_dict["network"],
+                    public_key=wallet_dict.get("public_key", "")
+                )
+                wallets.append(wallet)
+        
+        return wallets
+    
     def save_wallet_summary(
         self, 
         wallets: List[WalletData], 
@@ -333,12 +411,12 @@ class StorageManager:
         
         # Try to determine if it's encrypted
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            with open(filepath, 'rb') as f:
+                data = orjson.loads(f.read())
                 info["encrypted"] = data.get("encrypted", False)
                 if "wallets" in data:
                     info["wallet_count"] = len(data["wallets"])
-        except (json.JSONDecodeError, KeyError):
+        except (orjson.JSONDecodeError, KeyError):
             info["encrypted"] = False
             info["wallet_count"] = "Unknown"
         
@@ -411,7 +489,7 @@ class StorageManager:
                 "derivationPath": wallet.derivation_path if wallet.derivation_path else ""
             })
         
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(metamask_data, f, indent=2)
+        with open(filepath, 'wb') as f:
+            f.write(orjson.dumps(metamask_data, option=orjson.OPT_INDENT_2))
         
         return str(filepath) 
\ No newline at end of file
@@ -5,9 +5,12 @@ This module handles the generation of Ethereum-compatible wallets using
 BIP-39 mnemonics and BIP-44 derivation paths, following MetaMask standards.
 """
 
+import os
 import secrets
+import multiprocessing
 import hashlib
-from typing import Dict, List, Optional, Tuple, Union
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterator, List, Optional, Tuple, Union
 from dataclasses import dataclass
 from hdwallet import HDWallet
 from hdwallet.cryptocurrencies import Ethereum
@@ -17,6 +20,11 @@ from eth_account import Account
 from web3 import Web3
 
 
+# Below this many wallets the process pool start-up costs more than it saves;
+# shared with the CLI, which uses it to pick parallel batch generation
+PARALLEL_MIN_BATCH = 64
+
+
 @dataclass
 class WalletData:
     """Data class for wallet information."""
@@ -204,6 +212,74 @@ class WalletGenerator:
             
         return wallets
     
+    def generate_batch_wallets_parallel(
+        self,
+        count: int,
+        start_index: int = 0,
+        workers: Optional[int] = None
+    ) -> List[WalletData]:
+        """
+        Generate multiple wallets in batch across several processes.
+        
+        Key derivation is CPU-bound, so each wallet is derived in a worker
+        process. Small batches fall back to generate_batch_wallets.
+        
+        Args:
+            count: Number of wallets to generate
+            start_index: Starting index for wallet derivation
+            workers: Number of worker processes (defaults to the CPU count)
+            
+        Returns:
+            List of WalletData objects, ordered by derivation index
+        """
+        return list(self.iter_batch_wallets_parallel(count, start_index, workers))
+    
+    def iter_batch_wallets_parallel(
+        self,
+        count: int,
+        start_index: int = 0,
+        workers: Optional[int] = None
+    ) -> Iterator[WalletData]:
+        """
+        Yield wallets generated across several processes.
+        
+        Wallets are yielded in derivation index order while the rest of the
+        batch is still being generated, so callers can report progress.
+        
+        Args:
+            count: Number of wallets to generate
+            start_index: Starting index for wallet derivation
+            workers: Number of worker processes (defaults to the CPU count)
+            
+        Yields:
+            WalletData objects, ordered by derivation index
+        """
+        if workers is None:
+            workers = os.cpu_count() or 1
+        
+        if count < PARALLEL_MIN_BATCH or workers <= 1:
+            for i in range(count):
+                yield self.generate_new_wallet(index=start_index + i)
+            return
+        
+        workers = min(workers, count)
+        chunksize = max(1, count // (workers * 4))
+        
+        # Callers such as the CLI iterate while a progress thread is running;
+        # spawned workers avoid forking with that thread's locks held, and
+        # the initializer builds each worker's generator either way
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker_generator,
+            initargs=(self.network,)
+        ) as executor:
+            yield from executor.map(
+                _generate_wallet_at,
+                range(start_index, start_index + count),
+                chunksize=chunksize
+            )
+    
     def validate_mnemonic(self, mnemonic: str) -> bool:
         """
         Validate a mnemonic phrase.
@@ -286,4 +362,19 @@ class WalletGenerator:
         Returns:
             Checksummed address
         """
-        return self.w3.to_checksum_address(address) 
\ No newline at end of file
+        return self.w3.to_checksum_address(address) 
+
+
+# Generator owned by each worker process of generate_batch_wallets_parallel
+_worker_generator: Optional[WalletGenerator] = None
+
+
+def _init_worker_generator(network: str) -> None:
+    """Create the per-process wallet generator."""
+    global _worker_generator
+    _worker_generator = WalletGenerator(network)
+
+
+def _generate_wallet_at(index: int) -> WalletData:
+    """Generate a new wallet at the given index in a worker process."""
+    return _worker_generator.generate_new_wallet(index=index)
@@ -5,8 +5,24 @@ This module contains utility functions for validation,
 formatting, and other helper operations.
 """
 
-from .validators import validate_ethereum_address, validate_private_key, validate_mnemonic
-from .formatters import format_address, format_private_key, format_mnemonic
+from typing import TYPE_CHECKING
+
+from .lazy_imports import lazy_getattr
+
+if TYPE_CHECKING:
+    from .validators import validate_ethereum_address, validate_private_key, validate_mnemonic
+    from .formatters import format_address, format_private_key, format_mnemonic
+
+# validators and formatters both import web3, so helpers are resolved on first
+# access (PEP 562); importing config_manager or logger no longer pays for it
+_LAZY_IMPORTS = {
+    "validate_ethereum_address": ".validators",
+    "validate_private_key": ".validators",
+    "validate_mnemonic": ".validators",
+    "format_address": ".formatters",
+    "format_private_key": ".formatters",
+    "format_mnemonic": ".formatters",
+}
 
 __all__ = [
     "validate_ethereum_address",
@@ -15,4 +31,7 @@ __all__ = [
     "format_address",
     "format_private_key",
     "format_mnemonic"
-] 
\ No newline at end of file
+]
+
+
+__getattr__ = lazy_getattr(__name__, _LAZY_IMPORTS)
@@ -91,6 +91,9 @@ class ConfigManager:
                 "yaml": {
                     "enabled": True,
                     "default_flow_style": False
+                },
+                "ndjson": {
+                    "enabled": True
                 }
             },
             "logging": {
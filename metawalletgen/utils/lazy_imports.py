@@ -0,0 +1,46 @@
+"""
+Lazy Import Module
+
+This module builds the PEP 562 module-level __getattr__ used by the
+package __init__ files, so public names are imported from their
+submodules only when first accessed.
+"""
+
+import importlib
+import sys
+from typing import Any, Callable, Dict
+
+
+def lazy_getattr(package: str, lazy_imports: Dict[str, str]) -> Callable[[str], Any]:
+    """
+    Create a module __getattr__ that resolves names on first access.
+
+    Names listed in lazy_imports are imported from their submodule and
+    cached on the package. Any other name is tried as a submodule, so
+    `import metawalletgen; metawalletgen.core` keeps working.
+
+    Args:
+        package: Name of the package the function is installed in
+        lazy_imports: Mapping of public name to relative submodule path
+
+    Returns:
+        Function to assign to the package's __getattr__
+    """
+    def __getattr__(name: str) -> Any:
+        if name in lazy_imports:
+            module = importlib.import_module(lazy_imports[name], package)
+            value = getattr(module, name)
+            setattr(sys.modules[package], name, value)
+            return value
+
+        if not name.startswith("__"):
+            try:
+                return importlib.import_module(f".{name}", package)
+            except ModuleNotFoundError as e:
+                # Only a missing submodule means "no such attribute"
+                if e.name != f"{package}.{name}":
+                    raise
+
+        raise AttributeError(f"module {package!r} has no attribute {name!r}")
+
+    return __getattr__
@@ -7,6 +7,7 @@ with support for different levels, formats, and output destinations.
 
 import logging
 import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Dict, Any
 from rich.console import Console
@@ -265,6 +266,12 @@ class MetaWalletGenLogger:
 logger = MetaWalletGenLogger()
 
 
+@lru_cache(maxsize=None)
+def _named_logger(name: str) -> MetaWalletGenLogger:
+    """Create a named logger once so repeat lookups reuse its handlers."""
+    return MetaWalletGenLogger(name)
+
+
 def get_logger(name: Optional[str] = None) -> MetaWalletGenLogger:
     """
     Get logger instance.
@@ -276,7 +283,7 @@ def get_logger(name: Optional[str] = None) -> MetaWalletGenLogger:
         Logger instance
     """
     if name:
-        return MetaWalletGenLogger(name)
+        return _named_logger(name)
     return logger
 
 
@@ -299,5 +306,8 @@ def setup_logging(level: str = "INFO", log_file: Optional[str] = None,
     config.set("logging.file", log_file or "metawalletgen.log")
     config.set("logging.console", console)
     
+    # Named loggers pick up the new config the next time they are requested
+    _named_logger.cache_clear()
+    
     # Create new logger with updated config
     return MetaWalletGenLogger()
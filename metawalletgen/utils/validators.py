@@ -6,10 +6,20 @@ private keys, and mnemonic phrases.
 """
 
 import re
-from typing import Optional
+from typing import Iterable, List, Optional
 from web3 import Web3
 
 
+# Patterns compiled once at import rather than looked up in re's cache per call;
+# used with fullmatch, since "$" would also accept a trailing newline
+_ADDRESS_PATTERN = re.compile(r'0x[a-fA-F0-9]{40}')
+_PRIVATE_KEY_PATTERN = re.compile(r'[a-fA-F0-9]{64}')
+_PREFIXED_PRIVATE_KEY_PATTERN = re.compile(r'(?:0x)?([a-fA-F0-9]{64})')
+
+# Order of the secp256k1 group; valid private keys lie in [1, n - 1]
+SECP256K1_ORDER = 0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEBAAEDCE6AF48A03BBFD25E8CD0364141
+
+
 def validate_ethereum_address(address: str) -> bool:
     """
     Validate an Ethereum address format.
@@ -22,7 +32,7 @@ def validate_ethereum_address(address: str) -> bool:
     """
     try:
         # Check if it's a valid hex address
-        if not re.match(r'^0x[a-fA-F0-9]{40}$', address):
+        if not _ADDRESS_PATTERN.fullmatch(address):
             return False
         
         # Use web3 to validate checksum
@@ -48,12 +58,12 @@ def validate_private_key(private_key: str) -> bool:
             private_key = private_key[2:]
         
         # Check if it's a valid hex string of correct length
-        if not re.match(r'^[a-fA-F0-9]{64}$', private_key):
+        if not _PRIVATE_KEY_PATTERN.fullmatch(private_key):
             return False
         
         # Convert to int and check range
         private_key_int = int(private_key, 16)
-        if private_key_int == 0 or private_key_int >= 0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEBAAEDCE6AF48A03BBFD25E8CD0364141:
+        if private_key_int == 0 or private_key_int >= SECP256K1_ORDER:
             return False
         
         return True
@@ -61,6 +71,44 @@ def validate_private_key(private_key: str) -> bool:
         return False
 
 
+def validate_addresses(addresses: Iterable[str]) -> List[bool]:
+    """
+    Validate the format of many Ethereum addresses at once.
+    
+    Gives the same result as validate_ethereum_address for each address,
+    without the per-call overhead.
+    
+    Args:
+        addresses: Ethereum addresses to validate
+        
+    Returns:
+        List with True for each valid address, False otherwise
+    """
+    match = _ADDRESS_PATTERN.fullmatch
+    return [isinstance(address, str) and match(address) is not None for address in addresses]
+
+
+def validate_private_keys(private_keys: Iterable[str]) -> List[bool]:
+    """
+    Validate many private keys at once.
+    
+    Gives the same result as validate_private_key for each key,
+    without the per-call overhead.
+    
+    Args:
+        private_keys: Private keys to validate (with or without 0x prefix)
+        
+    Returns:
+        List with True for each valid private key, False otherwise
+    """
+    match = _PREFIXED_PRIVATE_KEY_PATTERN.fullmatch
+    results = []
+    for private_key in private_keys:
+        m = match(private_key) if isinstance(private_key, str) else None
+        results.append(m is not None and 0 < int(m.group(1), 16) < SECP256K1_ORDER)
+    return results
+
+
 def validate_mnemonic(mnemonic: str) -> bool:
     """
     Validate a BIP-39 mnemonic phrase.
@@ -159,7 +207,7 @@ def validate_output_format(format: str) -> bool:
     Returns:
         True if valid, False otherwise
     """
-    valid_formats = ["json", "csv", "yaml"]
+    valid_formats = ["json", "csv", "yaml", "ndjson"]
     return format.lower() in valid_formats
 
 